@@ -12,6 +12,7 @@ import aiofiles
 import os
 from pathlib import Path
 import uuid
+import time
 from datetime import datetime
 import logging
 
@@ -33,6 +34,7 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 # Allowed file types for Guru processing
 GURU_ALLOWED_EXTENSIONS = {'.txt', '.pdf', '.docx', '.md', '.py', '.js', '.html', '.css', '.json'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 
 # Guru-specific models
 class GuruDocumentRequest(BaseModel):
@@ -54,6 +56,25 @@ class TestGenerationRequest(BaseModel):
     focus_topics: Optional[List[str]] = None
 
 
+async def _save_upload(file: UploadFile, file_path: Path, max_size: Optional[int] = None) -> int:
+    """Stream an upload to disk in large chunks instead of reading it whole into memory"""
+    size = 0
+    async with aiofiles.open(file_path, 'wb') as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                break
+            await f.write(chunk)
+    
+    if max_size is not None and size > max_size:
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Max size: {max_size // (1024*1024)}MB"
+        )
+    return size
+
+
 @router.get("/", response_model=List[Document])
 async def get_documents(
     skip: int = 0,
@@ -137,9 +158,7 @@ async def upload_document(
     # Save file
     file_path = UPLOAD_DIR / f"{current_user.id}_{file.filename}"
     
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
+    await _save_upload(file, file_path)
     
     # Extract text content based on file type
     try:
@@ -239,9 +258,7 @@ async def upload_document_enhanced(
     
     # Save file
     try:
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        await _save_upload(file, file_path)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -686,20 +703,10 @@ async def upload_document_for_guru(
                 detail=f"File type {file_ext} not allowed for Guru processing. Supported: {', '.join(GURU_ALLOWED_EXTENSIONS)}"
             )
         
-        # Check file size
-        file_content = await file.read()
-        if len(file_content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"File too large. Max size: {MAX_FILE_SIZE // (1024*1024)}MB"
-            )
-        
-        # Save file
+        # Save file (size is checked while streaming)
         document_id = str(uuid.uuid4())
         file_path = UPLOAD_DIR / f"{document_id}_{file.filename}"
-        
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_content)
+        file_size = await _save_upload(file, file_path, max_size=MAX_FILE_SIZE)
         
         # Extract text content
         extracted_text = await extract_text_from_file(str(file_path), file.filename)
@@ -714,7 +721,7 @@ async def upload_document_for_guru(
                     filename=f"{document_id}_{file.filename}",
                     original_filename=file.filename,
                     file_type=file_ext,
-                    file_size=len(file_content),
+                    file_size=file_size,
                     file_path=str(file_path),
                     processing_status="completed",
                     extracted_text=extracted_text[:10000],  # Limit to 10k chars
@@ -730,7 +737,7 @@ async def upload_document_for_guru(
         return {
             "document_id": document_id,
             "filename": file.filename,
-            "file_size": len(file_content),
+            "file_size": file_size,
             "processing_status": "completed",
             "upload_timestamp": datetime.now().isoformat(),
             "guru_ready": True,
@@ -748,7 +755,7 @@ async def process_document_with_guru_agent(
 ):
     """Process uploaded document with Guru agent for explanation, testing, etc."""
     
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         # Get document (simplified file reading)
@@ -767,7 +774,7 @@ async def process_document_with_guru_agent(
             difficulty_level=request.difficulty_level
         )
         
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
         
         return GuruProcessingResponse(
             document_id=document_id,
@@ -7,6 +7,7 @@ import base64
 import os
 from typing import Optional
 from datetime import datetime
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import Response
 from pydantic import BaseModel, Field
@@ -56,10 +57,15 @@ def set_auto_voice_state(enabled: bool) -> bool:
     logger.info(f"Global auto-voice state changed to: {enabled}")
     return _global_auto_voice_enabled
 
+@lru_cache(maxsize=1)
+def _get_cached_murf_service(api_key: Optional[str]) -> MurfVoiceService:
+    """Build the Murf service (and its SDK client) once per API key"""
+    return MurfVoiceService(api_key=api_key)
+
 def get_murf_service():
     """Get initialized Murf service with API key from settings"""
     settings = get_settings()
-    service = MurfVoiceService(api_key=settings.murf_api_key)
+    service = _get_cached_murf_service(settings.murf_api_key)
     # Set the service auto-voice state to match global state
     service.set_auto_voice(get_auto_voice_state())
     return service
@@ -108,9 +114,7 @@ async def text_to_speech(request: TextToSpeechRequest, murf_service: MurfVoiceSe
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ TTS failed: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ TTS failed: %s", e)
         raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
 
 @router.get("/voices")
@@ -0,0 +1,88 @@
+"""
+Shared aiohttp client settings for outbound API calls (GitHub Models, Murf AI)
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+import orjson
+
+# Non-blocking DNS when aiodns is installed (pulled in by aiohttp[speedups],
+# which also adds Brotli response decoding)
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Shared request timeout: fail fast on connect stalls, keep the 30s overall budget
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=25)
+
+
+def json_dumps(obj) -> str:
+    """Serialize request payloads with orjson"""
+    return orjson.dumps(obj).decode()
+
+
+async def read_json(response: aiohttp.ClientResponse):
+    """Parse a response body with orjson"""
+    return orjson.loads(await response.read())
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a pooled client session with the shared connector and timeout settings"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+        ),
+        timeout=HTTP_TIMEOUT,
+        json_serialize=json_dumps
+    )
+
+
+class PooledSession:
+    """Lazily created shared session, rebuilt when used from a different event loop"""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and (self._session.closed or self._loop is not loop):
+            self._discard()
+        if self._session is None:
+            self._session = create_session()
+            self._loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the pooled session (called on app shutdown)"""
+        if self._session is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            session = self._session
+            self._session = None
+            self._loop = None
+            await session.close()
+        else:
+            self._discard()
+
+    def _discard(self):
+        """Drop the current session, closing it on its own loop when that loop still runs"""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # Its loop is gone, so the transports can't be closed; just release them
+            session.detach()
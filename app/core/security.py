@@ -81,7 +81,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             await self._validate_request_content(request)
         
         # Log request
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(f"Request: {request.method} {request.url.path} from {client_ip}")
         
         # Process request
@@ -91,7 +91,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         self._add_security_headers(response)
         
         # Log response time
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         logger.info(f"Response: {response.status_code} in {process_time:.3f}s")
         
         return response
@@ -2,12 +2,16 @@
 Production LLM Factory for BuddyAgents - Azure OpenAI Primary with GitHub Fallback
 """
 
+import asyncio
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
-from langchain.schema import ChatGeneration, LLMResult, AIMessage, HumanMessage, BaseMessage
+from langchain.schema import ChatGeneration, LLMResult, AIMessage, HumanMessage, SystemMessage, BaseMessage
 import aiohttp
 
+from app.core.http import PooledSession, read_json
+
 logger = logging.getLogger(__name__)
 
 # Import Azure OpenAI service
@@ -18,6 +22,34 @@ except ImportError:
     AZURE_AVAILABLE = False
     logger.warning("Azure OpenAI service not available")
 
+# Transient GitHub Models failures worth another attempt, and how many attempts in total
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+GITHUB_MAX_ATTEMPTS = 3
+MAX_RETRY_DELAY = 2.0
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After when given in seconds, else 125ms/500ms backoff"""
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 0.125 * 4 ** attempt
+    return min(delay, MAX_RETRY_DELAY)
+
+# Shared HTTP session for GitHub Models calls. Agents each build their own LLM
+# instance, so the pool lives at module level to keep connections warm.
+_http_session = PooledSession()
+
+async def close_http_session():
+    """Close the pooled GitHub Models session (called on app shutdown)"""
+    await _http_session.close()
+
+# GitHub Models API role for each LangChain message type
+_MESSAGE_ROLES = {
+    HumanMessage: "user",
+    AIMessage: "assistant",
+    SystemMessage: "system",
+}
+
 class WorkingGitHubLLM:
     """Working GitHub Models API LLM implementation"""
     
@@ -26,6 +58,11 @@ class WorkingGitHubLLM:
         self.model = model
         self.api_url = "https://models.inference.ai.azure.com/chat/completions"
         self._llm_type = "github"
+        # Built once; the shared session may serve other tokens, so they're sent per request
+        self._headers = {
+            "Authorization": f"Bearer {self.github_token}",
+            "Content-Type": "application/json"
+        }
     
     async def agenerate(self, messages_list, **kwargs):
         """Generate response using GitHub Models API"""
@@ -36,19 +73,13 @@ class WorkingGitHubLLM:
             # Convert messages to API format
             api_messages = []
             for msg in messages:
-                if hasattr(msg, 'content'):
-                    if msg.__class__.__name__ == 'HumanMessage':
-                        api_messages.append({"role": "user", "content": msg.content})
-                    elif msg.__class__.__name__ == 'AIMessage':
-                        api_messages.append({"role": "assistant", "content": msg.content})
+                if isinstance(msg, BaseMessage):
+                    role = _MESSAGE_ROLES.get(type(msg))
+                    if role:
+                        api_messages.append({"role": role, "content": msg.content})
                 else:
                     api_messages.append({"role": "user", "content": str(msg)})
             
-            headers = {
-                "Authorization": f"Bearer {self.github_token}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model,
                 "messages": api_messages,
@@ -56,30 +87,38 @@ class WorkingGitHubLLM:
                 "temperature": 0.7
             }
             
-            logger.info(f"🚀 Calling GitHub API for real AI response")
+            logger.info("🚀 Calling GitHub API for real AI response")
             
-            async with aiohttp.ClientSession() as session:
+            session = await _http_session.get()
+            for attempt in range(GITHUB_MAX_ATTEMPTS):
                 async with session.post(
                     self.api_url, 
-                    headers=headers, 
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
+                    headers=self._headers, 
+                    json=payload
                 ) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = await read_json(response)
                         content = result['choices'][0]['message']['content']
                         logger.info("✅ Real AI response generated successfully")
                         
                         generation = ChatGeneration(message=AIMessage(content=content))
                         return LLMResult(generations=[[generation]])
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"GitHub API error {response.status}: {error_text}")
+                    
+                    error_text = await response.text()
+                    if response.status not in RETRYABLE_STATUSES or attempt == GITHUB_MAX_ATTEMPTS - 1:
+                        logger.error("GitHub API error %d: %s", response.status, error_text)
                         generation = ChatGeneration(message=AIMessage(content=f"AI service error: {error_text}"))
                         return LLMResult(generations=[[generation]])
+                    
+                    status = response.status
+                    delay = _retry_delay(response, attempt)
+                
+                # Retry on the same pooled connection once the response is released
+                logger.warning("GitHub API error %d, retrying in %.2fs", status, delay)
+                await asyncio.sleep(delay)
                         
         except Exception as e:
-            logger.error(f"GitHub LLM error: {e}")
+            logger.error("GitHub LLM error: %s", e)
             generation = ChatGeneration(message=AIMessage(content=f"Sorry, I'm having trouble: {str(e)}"))
             return LLMResult(generations=[[generation]])
 
@@ -110,6 +149,11 @@ class SimpleLLM:
             generation = ChatGeneration(message=AIMessage(content="Error in fallback system"))
             return LLMResult(generations=[[generation]])
 
+@lru_cache(maxsize=1)
+def _get_github_llm(github_token: str) -> WorkingGitHubLLM:
+    """Reuse one GitHub LLM client per token instead of building one per agent/request"""
+    return WorkingGitHubLLM(github_token=github_token)
+
 class LLMFactory:
     """Factory class for creating working LLM instances"""
     
@@ -125,7 +169,7 @@ class LLMFactory:
                 from app.core.config import settings
                 if settings.GITHUB_TOKEN:
                     logger.info("🚀 Creating REAL GitHub LLM (no fallback)")
-                    return WorkingGitHubLLM(github_token=settings.GITHUB_TOKEN)
+                    return _get_github_llm(settings.GITHUB_TOKEN)
                 else:
                     logger.error("❌ No GitHub token - CANNOT USE REAL AI")
             except Exception as e:
@@ -18,6 +18,8 @@ from fastapi.staticfiles import StaticFiles
 from app.core.config import get_settings
 from app.core.security import SecurityMiddleware, RateLimitService
 from app.llm.azure_openai_service import azure_openai_service  # Re-enabled for chat
+from app.llm.llm_factory import close_http_session
+from app.murf_streaming import murf_service, murf_client
 from app.services.voice import get_voice_manager
 
 # Import API routers
@@ -63,7 +65,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down BuddyAgents Platform...")
-    # Cleanup tasks here
+    # Close pooled HTTP sessions for the LLM and TTS clients
+    await close_http_session()
+    await murf_service.aclose()
+    await murf_client.service.aclose()
     logger.info("✅ Shutdown complete")
 
 
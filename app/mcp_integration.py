@@ -391,9 +391,7 @@ class MCPManager:
             return enhanced_progress
             
         except Exception as e:
-            logger.error(f"❌ AI progress analysis failed: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ AI progress analysis failed: %s", e)
             # Fall back to basic progress
             return basic_progress
     
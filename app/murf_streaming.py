@@ -10,17 +10,39 @@ import time
 import logging
 import uuid
 import os
+import hashlib
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Optional, AsyncGenerator, Dict, Any
 import aiohttp
 import websockets
 
+from app.core.http import HTTP_TIMEOUT, PooledSession, read_json
+
 logger = logging.getLogger(__name__)
 
+# Agent voice mappings, shared read-only by every service instance
+AGENT_VOICES = MappingProxyType({
+    "mitra": "hi-IN-shweta",
+    "guru": "en-IN-isha",
+    "parikshak": "en-IN-isha"
+})
+DEFAULT_VOICE_ID = AGENT_VOICES["mitra"]
+
+# Audio cache limits per service. 44K 16-bit WAV is ~88 KB per second of speech,
+# so only short texts (greetings, fallback replies) are kept, within a byte budget.
+TTS_CACHE_MAX_TEXT = 200
+TTS_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
 class MurfAIService:
     """Production Murf AI service with FIXED WebSocket authentication"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv("MURF_API_KEY")
+        # Optional caller-owned session so repeated calls reuse pooled connections
+        self.session = session
+        # Session created lazily when the caller doesn't supply one; closed by aclose()
+        self._own_session = PooledSession()
         
         # CORRECTED endpoints
         self.base_url = "https://api.murf.ai/v1"
@@ -29,48 +51,117 @@ class MurfAIService:
         self.websocket_url = "wss://api.murf.ai/v1/speech/stream-input"
         
         # Agent voice mappings
-        self.agent_voices = {
-            "mitra": "hi-IN-shweta",
-            "guru": "en-IN-isha", 
-            "parikshak": "en-IN-isha"
-        }
+        self.agent_voices = AGENT_VOICES
+        
+        # LRU of synthesized audio so repeated greetings skip the Murf round trip
+        self._tts_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._tts_cache_bytes = 0
+        # Requests currently being synthesized, so identical concurrent calls share one
+        self._inflight: Dict[str, asyncio.Future] = {}
         
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+    
+    @api_key.setter
+    def api_key(self, value: Optional[str]):
+        self._api_key = value
+        # Request headers built once per key; sent per request since the session may be shared
+        self._headers = {
+            "api-key": value,
+            "Content-Type": "application/json"
+        }
+    
+    def _speech_payload(self, text: str, agent_type: str) -> Dict[str, Any]:
+        """Build the HTTP synthesis request body for an agent's voice"""
+        return {
+            "voiceId": self.agent_voices.get(agent_type, DEFAULT_VOICE_ID),
+            "text": text,
+            "format": "WAV",
+            "sampleRate": "44K",
+            # Audio inline in the response instead of a URL to download
+            "encodeAsBase64": True
+        }
+    
     async def generate_speech_http(self, text: str, agent_type: str = "mitra") -> Optional[bytes]:
         """Generate speech using HTTP API (working method)"""
         try:
-            voice_id = self.agent_voices.get(agent_type, "hi-IN-shweta")
+            payload = self._speech_payload(text, agent_type)
             
-            headers = {
-                "api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
+            cache_key = hashlib.sha256(
+                f"{payload['voiceId']}|{payload['format']}|{payload['sampleRate']}|{text}".encode()
+            ).hexdigest()
+            cached = self._tts_cache.get(cache_key)
+            if cached is not None:
+                self._tts_cache.move_to_end(cache_key)
+                return cached
             
-            payload = {
-                "voiceId": voice_id,
-                "text": text,
-                "format": "WAV",
-                "sampleRate": "44K"
-            }
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                # Shielded so a cancelled waiter doesn't cancel the shared request
+                return await asyncio.shield(inflight)
             
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(self.generate_url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        audio_url = data.get("audioFile")
-                        
-                        if audio_url:
-                            async with session.get(audio_url) as audio_response:
-                                if audio_response.status == 200:
-                                    audio_data = await audio_response.read()
-                                    logger.info(f"✅ Speech generated: {len(audio_data)} bytes")
-                                    return audio_data
-            return None
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            try:
+                session = await self._get_session()
+                # Passed per call since an injected session may have its own default
+                audio_data = await self._fetch_speech(session, self._headers, payload, HTTP_TIMEOUT)
+                
+                if audio_data and len(text) <= TTS_CACHE_MAX_TEXT:
+                    self._tts_cache[cache_key] = audio_data
+                    self._tts_cache_bytes += len(audio_data)
+                    while self._tts_cache_bytes > TTS_CACHE_MAX_BYTES:
+                        _, evicted = self._tts_cache.popitem(last=False)
+                        self._tts_cache_bytes -= len(evicted)
+                future.set_result(audio_data)
+                return audio_data
+            finally:
+                # Waiters see a failure the same way direct callers do: None
+                if not future.done():
+                    future.set_result(None)
+                self._inflight.pop(cache_key, None)
             
         except Exception as e:
-            logger.error(f"❌ HTTP TTS failed: {e}")
+            logger.error("❌ HTTP TTS failed: %s", e)
             return None
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session, or a pooled one created on first use"""
+        if self.session is not None:
+            return self.session
+        return await self._own_session.get()
+    
+    async def aclose(self):
+        """Close the session this service created (an injected one is left to its owner)"""
+        await self._own_session.close()
+    
+    async def _fetch_speech(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        timeout: aiohttp.ClientTimeout
+    ) -> Optional[bytes]:
+        """Request synthesis and return the audio (inline, or downloaded from the audio URL)"""
+        async with session.post(self.generate_url, headers=headers, json=payload, timeout=timeout) as response:
+            if response.status == 200:
+                data = await read_json(response)
+                encoded_audio = data.get("encodedAudio")
+                if encoded_audio:
+                    audio_data = base64.b64decode(encoded_audio)
+                    logger.info("✅ Speech generated: %d bytes", len(audio_data))
+                    return audio_data
+                
+                audio_url = data.get("audioFile")
+                if audio_url:
+                    async with session.get(audio_url, timeout=timeout) as audio_response:
+                        if audio_response.status == 200:
+                            audio_data = await audio_response.read()
+                            logger.info("✅ Speech generated: %d bytes", len(audio_data))
+                            return audio_data
+        return None
+    
     async def stream_speech_websocket(self, text: str, agent_type: str = "mitra") -> AsyncGenerator[bytes, None]:
         """Stream speech with FIXED WebSocket authentication"""
         try:
@@ -111,7 +202,7 @@ class MurfAIService:
                 return
             
             # Send voice config and text
-            voice_id = self.agent_voices.get(agent_type, "hi-IN-shweta")
+            voice_id = self.agent_voices.get(agent_type, DEFAULT_VOICE_ID)
             
             voice_config = {"voiceId": voice_id, "format": "WAV", "sampleRate": "44K"}
             await websocket.send(json.dumps(voice_config))
@@ -171,12 +262,26 @@ class MurfAIService:
         if not self.api_key:
             return results
         
-        # Test HTTP generation to validate auth
-        for agent, voice_id in self.agent_voices.items():
-            test_text = f"Hello, I am {agent}, your AI assistant."
-            audio_data = await self.generate_speech_http(test_text, agent)
-            working = bool(audio_data and len(audio_data) > 1000)
-            results["agent_voices"][agent] = {"voice_id": voice_id, "working": working}
+        # Test HTTP generation for every agent concurrently to validate auth.
+        # Goes straight to Murf: a cached clip would report a revoked key as valid.
+        semaphore = asyncio.Semaphore(3)
+        session = await self._get_session()
+        
+        async def check_voice(agent: str) -> bool:
+            async with semaphore:
+                payload = self._speech_payload(f"Hello, I am {agent}, your AI assistant.", agent)
+                try:
+                    audio_data = await self._fetch_speech(session, self._headers, payload, HTTP_TIMEOUT)
+                except Exception as e:
+                    logger.error("❌ Voice check failed for %s: %s", agent, e)
+                    return False
+                return bool(audio_data and len(audio_data) > 1000)
+        
+        agents = list(self.agent_voices)
+        checks = await asyncio.gather(*(check_voice(agent) for agent in agents))
+        
+        for agent, working in zip(agents, checks):
+            results["agent_voices"][agent] = {"voice_id": self.agent_voices[agent], "working": working}
             if working:
                 results["test_synthesis"] = True
                 results["auth_token_valid"] = True
@@ -21,6 +21,14 @@ from app.voice_config import AGENT_VOICE_CONFIG, get_agent_voice, get_voice_info
 
 logger = logging.getLogger(__name__)
 
+# Language-code prefixes treated as Indian voices
+INDIAN_LANGUAGE_PREFIXES = ("hi", "en-IN")
+
+
+def _voice_language(voice: Dict[str, Any]) -> str:
+    """Language code of a voice entry, whichever key the API response used"""
+    return voice.get("languageCode") or voice.get("language") or voice.get("locale") or ""
+
 
 class MurfAIClient:
     """Production-ready Murf AI client with working endpoints and voice IDs"""
@@ -216,8 +224,10 @@ class MurfAIClient:
         results["voices_available"] = len(voices) > 0
         
         # Count Indian voices
-        indian_voices = [v for v in voices if v.get("languageCode", "").startswith(("hi", "en-IN"))]
-        results["indian_voices"] = len(indian_voices)
+        results["indian_voices"] = sum(
+            1 for language in map(_voice_language, voices)
+            if language.startswith(INDIAN_LANGUAGE_PREFIXES)
+        )
         
         # Test each agent voice
         for agent, voice_id in self.agent_voices.items():
@@ -106,7 +106,7 @@ class AzureOpenAIService:
             "error": None
         }
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Test chat model (Model Router)
@@ -124,7 +124,7 @@ class AzureOpenAIService:
             }
             
             # Calculate response time
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter() - start_time) * 1000
             health_status["response_time_ms"] = round(response_time, 2)
             health_status["healthy"] = True
             
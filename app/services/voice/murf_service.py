@@ -6,10 +6,11 @@ and caching for minimal latency.
 """
 
 import os
+import time
 import asyncio
 import hashlib
 import base64
-from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, Any, TYPE_CHECKING
 from pydantic import BaseModel
 from fastapi import HTTPException
 import httpx
@@ -128,6 +129,11 @@ AGENT_VOICE_MAPPING = {
     }
 }
 
+# Voice catalog cache shared by every service instance (voice API, voice service manager).
+# Keyed by a hash of the API key so the key itself isn't kept around.
+VOICE_CATALOG_TTL_SECONDS = 3600
+_voice_catalog_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
 class MurfVoiceService:
     """
     Murf AI Voice Service using official SDK for high-quality text-to-speech generation
@@ -175,6 +181,11 @@ class MurfVoiceService:
         """
         if not self.api_key:
             raise HTTPException(status_code=503, detail="Voice service not configured")
+        
+        cache_key = hashlib.blake2b(self.api_key.encode(), digest_size=8).hexdigest()
+        cached = _voice_catalog_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < VOICE_CATALOG_TTL_SECONDS:
+            return cached[1]
             
         try:
             async with httpx.AsyncClient() as client:
@@ -192,6 +203,8 @@ class MurfVoiceService:
                 logger.info(f"Voices API Response Status: {response.status_code}")
                 
                 if response.status_code != 200:
+                    # Drop any stale catalog, e.g. after the key was revoked
+                    _voice_catalog_cache.pop(cache_key, None)
                     error_text = response.text
                     logger.error(f"Voices API Error: {error_text}")
                     raise HTTPException(
@@ -200,9 +213,11 @@ class MurfVoiceService:
                     )
                 
                 data = response.json()
-                logger.info(f"Successfully fetched {len(data.get('voices', []))} voices")
+                voices = data.get('voices', [])
+                logger.info(f"Successfully fetched {len(voices)} voices")
                 
-                return data.get('voices', [])
+                _voice_catalog_cache[cache_key] = (time.monotonic(), voices)
+                return voices
                 
         except httpx.TimeoutException:
             logger.error("Timeout fetching voices from Murf API")
@@ -288,7 +303,7 @@ class MurfVoiceService:
         if self.voice_cache:
             cached_audio = await self.voice_cache.get_cached_speech(text, voice_id)
             if cached_audio:
-                logger.info(f"✅ Cache hit for voice {voice_id} - instant response")
+                logger.info("✅ Cache hit for voice %s - instant response", voice_id)
                 if isinstance(cached_audio, dict) and "audio_data" in cached_audio:
                     return cached_audio["audio_data"]
                 elif isinstance(cached_audio, (bytes, str)):
@@ -309,7 +324,7 @@ class MurfVoiceService:
             if pitch != 1.0:
                 generation_params["pitch"] = int((pitch - 1.0) * 50)  # Convert to Murf pitch (-50 to 50)
             
-            logger.info(f"🎤 Generating speech with Murf AI: voice={voice_id}, length={len(text)}")
+            logger.info("🎤 Generating speech with Murf AI: voice=%s, length=%d", voice_id, len(text))
             start_time = asyncio.get_event_loop().time()
             
             # Use optimized thread pool for better performance
@@ -337,7 +352,7 @@ class MurfVoiceService:
                 if self.voice_cache:
                     asyncio.create_task(self.voice_cache.cache_generated_speech(text, voice_id, base64.b64decode(audio_data)))
                 
-                logger.info(f"✅ Speech generated in {generation_time:.2f}s: base64 length={len(audio_data)}")
+                logger.info("✅ Speech generated in %.2fs: base64 length=%d", generation_time, len(audio_data))
                 return audio_data
             else:
                 # Download audio from URL with parallel caching
@@ -357,16 +372,16 @@ class MurfVoiceService:
                     if self.voice_cache:
                         asyncio.create_task(self.voice_cache.cache_generated_speech(text, voice_id, audio_bytes))
                     
-                    logger.info(f"✅ Speech generated in {generation_time:.2f}s: {len(audio_bytes)} bytes")
+                    logger.info("✅ Speech generated in %.2fs: %d bytes", generation_time, len(audio_bytes))
                     return audio_bytes
                 
         except asyncio.TimeoutError:
-            logger.error(f"Speech generation timeout after 15s for voice {voice_id}")
+            logger.error("Speech generation timeout after 15s for voice %s", voice_id)
             raise HTTPException(status_code=408, detail="Voice generation timeout - please try again")
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in speech generation: {e}")
+            logger.error("Unexpected error in speech generation: %s", e)
             raise HTTPException(status_code=500, detail=f"Internal voice service error: {str(e)}")
     
     async def generate_speech_with_ssml(
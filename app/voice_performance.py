@@ -70,7 +70,7 @@ class VoicePerformanceMonitor:
             session_id=session_id,
             agent_type=agent_type,
             text_length=len(text),
-            start_time=time.time()
+            start_time=time.perf_counter()
         )
         
         self.active_sessions[session_id] = metrics
@@ -82,7 +82,7 @@ class VoicePerformanceMonitor:
         if session_id in self.active_sessions:
             metrics = self.active_sessions[session_id]
             if not metrics.first_chunk_time:  # Only record the first chunk
-                metrics.first_chunk_time = time.time()
+                metrics.first_chunk_time = time.perf_counter()
                 metrics.total_audio_bytes += chunk_size
                 metrics.chunk_count += 1
                 
@@ -103,7 +103,7 @@ class VoicePerformanceMonitor:
         """Complete a voice generation session"""
         if session_id in self.active_sessions:
             metrics = self.active_sessions[session_id]
-            metrics.completion_time = time.time()
+            metrics.completion_time = time.perf_counter()
             metrics.success = success
             metrics.error_message = error
             
@@ -9,9 +9,10 @@ import streamlit as st
 import requests
 import json
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional
-import base64
 from streamlit_mic_recorder import mic_recorder
 
 # Speech-to-Text function
@@ -24,76 +25,48 @@ def transcribe_audio(audio_bytes):
         return "No audio data received"
     
     try:
-        import tempfile
-        import os
         import speech_recognition as sr
         from pydub import AudioSegment
-        import io
-        
-        # Create temporary files
-        temp_input_path = None
-        temp_wav_path = None
         
+        # Decode and re-encode in memory; no temp files on the script thread
         try:
-            # Save the audio bytes to a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_input:
-                temp_input.write(audio_bytes)
-                temp_input_path = temp_input.name
-            
-            # Convert audio to WAV format using pydub
             # streamlit-mic-recorder typically outputs WebM format
-            try:
-                # Try to load as WebM first
-                audio = AudioSegment.from_file(temp_input_path, format="webm")
-            except:
-                try:
-                    # Try other formats
-                    audio = AudioSegment.from_file(temp_input_path)
-                except:
-                    # Try loading as raw bytes
-                    audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
-            
-            # Convert to WAV format (16-bit, mono, 16kHz - optimal for speech recognition)
-            audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
-            
-            # Export as WAV
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_wav:
-                temp_wav_path = temp_wav.name
-                audio.export(temp_wav_path, format="wav")
-            
-            # Initialize speech recognizer
-            recognizer = sr.Recognizer()
+            audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format="webm")
+        except:
+            # Let pydub/ffmpeg probe other formats
+            audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
+        
+        # Convert to WAV format (16-bit, mono, 16kHz - optimal for speech recognition)
+        audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+        
+        wav_buffer = io.BytesIO()
+        audio.export(wav_buffer, format="wav")
+        wav_buffer.seek(0)
+        
+        # Initialize speech recognizer
+        recognizer = sr.Recognizer()
+        
+        # Load and process the WAV data
+        with sr.AudioFile(wav_buffer) as source:
+            # Adjust for ambient noise
+            recognizer.adjust_for_ambient_noise(source, duration=1)
+            audio_data = recognizer.record(source)
+        
+        # Try Google Speech Recognition first (requires internet)
+        try:
+            text = recognizer.recognize_google(audio_data)
+            return text if text.strip() else "No speech detected"
             
-            # Load and process the WAV file
-            with sr.AudioFile(temp_wav_path) as source:
-                # Adjust for ambient noise
-                recognizer.adjust_for_ambient_noise(source, duration=1)
-                audio_data = recognizer.record(source)
+        except sr.UnknownValueError:
+            return "Could not understand the audio. Please speak clearly."
             
-            # Try Google Speech Recognition first (requires internet)
+        except sr.RequestError:
+            # Fallback to offline recognition
             try:
-                text = recognizer.recognize_google(audio_data)
+                text = recognizer.recognize_sphinx(audio_data)
                 return text if text.strip() else "No speech detected"
-                
-            except sr.UnknownValueError:
-                return "Could not understand the audio. Please speak clearly."
-                
-            except sr.RequestError:
-                # Fallback to offline recognition
-                try:
-                    text = recognizer.recognize_sphinx(audio_data)
-                    return text if text.strip() else "No speech detected"
-                except:
-                    return "Speech recognition service unavailable. Please check your internet connection."
-            
-        finally:
-            # Clean up temporary files
-            for path in [temp_input_path, temp_wav_path]:
-                if path and os.path.exists(path):
-                    try:
-                        os.unlink(path)
-                    except:
-                        pass
+            except:
+                return "Speech recognition service unavailable. Please check your internet connection."
                         
     except ImportError as e:
         missing_lib = str(e).split("'")[1] if "'" in str(e) else "speech recognition library"
@@ -115,6 +88,22 @@ st.set_page_config(
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
 
+@st.cache_resource
+def get_thread_sessions() -> threading.local:
+    """Per-thread HTTP sessions shared across reruns (a requests.Session isn't thread-safe)"""
+    return threading.local()
+
+def _thread_session(sessions: threading.local) -> requests.Session:
+    """Return the calling thread's pooled session, creating it on first use"""
+    session = getattr(sessions, "session", None)
+    if session is None:
+        session = sessions.session = requests.Session()
+    return session
+
+def get_http_session() -> requests.Session:
+    """Pooled HTTP session for the current script thread (keeps backend connections alive)"""
+    return _thread_session(get_thread_sessions())
+
 # Session state initialization with persistence
 if 'candidate_id' not in st.session_state:
     st.session_state.candidate_id = None
@@ -143,7 +132,7 @@ def load_session_from_storage():
 def validate_candidate_session(candidate_id: str) -> bool:
     """Validate if a candidate session is still valid"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/candidates/candidate/{candidate_id}/progress")
+        response = get_http_session().get(f"{API_BASE_URL}/api/v1/candidates/candidate/{candidate_id}/progress")
         return response.status_code == 200
     except:
         return False
@@ -163,7 +152,7 @@ load_session_from_storage()
 def register_candidate(name: str, email: str, skills: list, experience: str, target_role: str) -> Optional[str]:
     """Register a new candidate"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/candidates/register",
             json={
                 "name": name,
@@ -190,7 +179,7 @@ def register_candidate(name: str, email: str, skills: list, experience: str, tar
 def login_candidate(email: str) -> Optional[Dict[str, Any]]:
     """Login existing candidate by email"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/candidates/login",
             json={"email": email}
         )
@@ -221,7 +210,7 @@ def send_chat_message(agent_type: str, message: str, candidate_id: str, session_
         if session_id:
             payload["session_id"] = session_id
         
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/chat/enhanced",
             json=payload
         )
@@ -285,7 +274,7 @@ def check_and_prompt_registration(agent_name: str) -> bool:
                             "preferred_language": preferred_language
                         }
                         
-                        response = requests.post(f"{API_BASE_URL}/api/v1/candidates/register", json=candidate_data)
+                        response = get_http_session().post(f"{API_BASE_URL}/api/v1/candidates/register", json=candidate_data)
                         
                         if response.status_code == 200:
                             candidate_data = response.json()
@@ -309,7 +298,7 @@ def upload_document_to_guru(candidate_id: str, file) -> Optional[str]:
         files = {"file": file}
         data = {"candidate_id": candidate_id}
         
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/documents/guru/upload",
             files=files,
             data=data
@@ -327,7 +316,7 @@ def upload_document_to_guru(candidate_id: str, file) -> Optional[str]:
 def process_document_with_guru(document_id: str, action: str, topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Process document with Guru agent"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/documents/guru/process/{document_id}",
             json={
                 "action": action,
@@ -348,7 +337,7 @@ def process_document_with_guru(document_id: str, action: str, topic: Optional[st
 def test_voice_generation(agent_type: str, text: str) -> Optional[bytes]:
     """Test voice generation for an agent"""
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/api/v1/voice/tts",
             json={
                 "text": text,
@@ -365,10 +354,64 @@ def test_voice_generation(agent_type: str, text: str) -> Optional[bytes]:
         st.error(f"Voice error: {str(e)}")
         return None
 
+
+@st.cache_resource
+def get_voice_executor() -> ThreadPoolExecutor:
+    """Background workers for auto-play TTS so chat rendering doesn't wait on it"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="auto-voice")
+
+def _synthesize_voice(sessions: threading.local, agent_type: str, text: str) -> Optional[bytes]:
+    """Fetch TTS audio off the script thread (no st.* calls allowed here)"""
+    try:
+        response = _thread_session(sessions).post(
+            f"{API_BASE_URL}/api/v1/voice/tts",
+            json={
+                "text": text,
+                "agent": agent_type
+            },
+            timeout=35
+        )
+        if response.status_code == 200:
+            return response.content
+    except requests.RequestException:
+        pass
+    return None
+
+def start_auto_voice(agent_type: str, text: str):
+    """Start generating voice for a new reply in the background"""
+    st.session_state[f"voice_job_{agent_type}"] = get_voice_executor().submit(
+        _synthesize_voice, get_thread_sessions(), agent_type, text
+    )
+
+@st.fragment(run_every=0.5)
+def pending_voice_poller(agent_type: str):
+    """Poll the background TTS job and rerun the app once audio is ready"""
+    job = st.session_state.get(f"voice_job_{agent_type}")
+    if job is None:
+        return
+    if not job.done():
+        st.caption("🔊 Preparing voice...")
+        return
+    
+    del st.session_state[f"voice_job_{agent_type}"]
+    st.session_state[f"voice_audio_{agent_type}"] = job.result()
+    st.rerun()
+
+def show_auto_voice(agent_type: str):
+    """Auto-play finished voice for the latest reply, or keep polling for it"""
+    if f"voice_audio_{agent_type}" in st.session_state:
+        audio_data = st.session_state.pop(f"voice_audio_{agent_type}")
+        if audio_data:
+            st.audio(audio_data, format='audio/wav', autoplay=True)
+        else:
+            st.warning("Voice generation failed for this reply")
+    elif f"voice_job_{agent_type}" in st.session_state:
+        pending_voice_poller(agent_type)
+
 def get_candidate_progress(candidate_id: str) -> Optional[Dict[str, Any]]:
     """Get candidate progress data"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/candidates/candidate/{candidate_id}/progress")
+        response = get_http_session().get(f"{API_BASE_URL}/api/v1/candidates/candidate/{candidate_id}/progress")
         
         if response.status_code == 200:
             return response.json()
@@ -524,50 +567,55 @@ with st.sidebar:
         )
         st.session_state.auto_audio = auto_audio
 
+@st.fragment
+def voice_testing_panel():
+    """Voice testing controls; reruns only this panel on interaction"""
+    st.subheader("Test Voice Generation")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        test_agent = st.selectbox(
+            "Select Agent Voice",
+            ["mitra", "guru", "parikshak"],
+            format_func=lambda x: {
+                "mitra": "🤗 Mitra (मित्र) - Hindi",
+                "guru": "👨‍🏫 Guru (गुरु) - English", 
+                "parikshak": "🎯 Parikshak (परीक्षक) - English"
+            }[x]
+        )
+
+        test_text = st.text_area(
+            "Text to Convert",
+            value={
+                "mitra": "नमस्ते! मैं मित्र हूँ। आप कैसे हैं?",
+                "guru": "Hello! I'm Guru, your learning mentor. How can I help you today?",
+                "parikshak": "Welcome! I'm Parikshak, your interview coach. Let's practice together."
+            }[test_agent],
+            height=100
+        )
+
+    with col2:
+        if st.button("🎵 Generate Voice", type="primary"):
+            if test_text.strip():
+                with st.spinner("Generating audio..."):
+                    audio_data = test_voice_generation(test_agent, test_text)
+
+                    if audio_data:
+                        st.success(f"✅ Audio generated! ({len(audio_data)} bytes)")
+                        st.audio(audio_data, format='audio/wav')
+                    else:
+                        st.error("❌ Failed to generate audio")
+            else:
+                st.warning("Please enter some text to convert")
+
 # Main content area
 if st.session_state.candidate_id is None:
     st.info("👈 Please register as a candidate to start using the platform")
 else:
     # Voice Testing Section
     with st.expander("🎵 Voice Testing (TTS)", expanded=False):
-        st.subheader("Test Voice Generation")
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            test_agent = st.selectbox(
-                "Select Agent Voice",
-                ["mitra", "guru", "parikshak"],
-                format_func=lambda x: {
-                    "mitra": "🤗 Mitra (मित्र) - Hindi",
-                    "guru": "👨‍🏫 Guru (गुरु) - English", 
-                    "parikshak": "🎯 Parikshak (परीक्षक) - English"
-                }[x]
-            )
-            
-            test_text = st.text_area(
-                "Text to Convert",
-                value={
-                    "mitra": "नमस्ते! मैं मित्र हूँ। आप कैसे हैं?",
-                    "guru": "Hello! I'm Guru, your learning mentor. How can I help you today?",
-                    "parikshak": "Welcome! I'm Parikshak, your interview coach. Let's practice together."
-                }[test_agent],
-                height=100
-            )
-        
-        with col2:
-            if st.button("🎵 Generate Voice", type="primary"):
-                if test_text.strip():
-                    with st.spinner("Generating audio..."):
-                        audio_data = test_voice_generation(test_agent, test_text)
-                        
-                        if audio_data:
-                            st.success(f"✅ Audio generated! ({len(audio_data)} bytes)")
-                            st.audio(audio_data, format='audio/wav')
-                        else:
-                            st.error("❌ Failed to generate audio")
-                else:
-                    st.warning("Please enter some text to convert")
+        voice_testing_panel()
     
     # Agent selection tabs
     tab1, tab2, tab3 = st.tabs(["🤗 Mitra (मित्र)", "👨‍🏫 Guru (गुरु)", "🎯 Parikshak (परीक्षक)"])
@@ -596,11 +644,9 @@ else:
                         # Only auto-play voice for the LATEST assistant message if auto-audio is enabled
                         is_latest_message = (i == len(st.session_state.chat_history['mitra']) - 1)
                         if is_latest_message and getattr(st.session_state, 'auto_audio', False) and getattr(st.session_state, 'new_response_mitra', False):
-                            # Generate and auto-play voice for latest response only
-                            audio_data = test_voice_generation('mitra', msg['content'])
-                            if audio_data:
-                                st.audio(audio_data, format='audio/wav', autoplay=True)
-                            # Reset the flag after playing
+                            # Generate voice in the background so the rest of the page renders now
+                            start_auto_voice('mitra', msg['content'])
+                            # Reset the flag once the job is started
                             st.session_state.new_response_mitra = False
                         elif not getattr(st.session_state, 'auto_audio', False):
                             # Show manual voice button
@@ -609,6 +655,9 @@ else:
                                     audio_data = test_voice_generation('mitra', msg['content'])
                                     if audio_data:
                                         st.audio(audio_data, format='audio/wav')
+                        
+                        if is_latest_message:
+                            show_auto_voice('mitra')
         
         # Voice input section
         st.write("🎙️ **Voice Input** (Speak your question)")
@@ -705,11 +754,9 @@ else:
                         # Only auto-play voice for the LATEST assistant message if auto-audio is enabled
                         is_latest_message = (i == len(st.session_state.chat_history['guru']) - 1)
                         if is_latest_message and getattr(st.session_state, 'auto_audio', False) and getattr(st.session_state, 'new_response_guru', False):
-                            # Generate and auto-play voice for latest response only
-                            audio_data = test_voice_generation('guru', msg['content'])
-                            if audio_data:
-                                st.audio(audio_data, format='audio/wav', autoplay=True)
-                            # Reset the flag after playing
+                            # Generate voice in the background so the rest of the page renders now
+                            start_auto_voice('guru', msg['content'])
+                            # Reset the flag once the job is started
                             st.session_state.new_response_guru = False
                         elif not getattr(st.session_state, 'auto_audio', False):
                             # Show manual voice button
@@ -718,6 +765,9 @@ else:
                                     audio_data = test_voice_generation('guru', msg['content'])
                                     if audio_data:
                                         st.audio(audio_data, format='audio/wav')
+                        
+                        if is_latest_message:
+                            show_auto_voice('guru')
             
             # Voice input section
             st.write("🎙️ **Voice Input** (Speak your question)")
@@ -860,11 +910,9 @@ else:
                         # Only auto-play voice for the LATEST assistant message if auto-audio is enabled
                         is_latest_message = (i == len(st.session_state.chat_history['parikshak']) - 1)
                         if is_latest_message and getattr(st.session_state, 'auto_audio', False) and getattr(st.session_state, 'new_response_parikshak', False):
-                            # Generate and auto-play voice for latest response only
-                            audio_data = test_voice_generation('parikshak', msg['content'])
-                            if audio_data:
-                                st.audio(audio_data, format='audio/wav', autoplay=True)
-                            # Reset the flag after playing
+                            # Generate voice in the background so the rest of the page renders now
+                            start_auto_voice('parikshak', msg['content'])
+                            # Reset the flag once the job is started
                             st.session_state.new_response_parikshak = False
                         elif not getattr(st.session_state, 'auto_audio', False):
                             # Show manual voice button
@@ -873,6 +921,9 @@ else:
                                     audio_data = test_voice_generation('parikshak', msg['content'])
                                     if audio_data:
                                         st.audio(audio_data, format='audio/wav')
+                        
+                        if is_latest_message:
+                            show_auto_voice('parikshak')
         
         # Voice input section
         st.write("🎙️ **Voice Input** (Speak your question)")
@@ -8,6 +8,7 @@ Dedicated page for emotional support and friendly conversations.
 import streamlit as st
 from datetime import datetime
 import time
+import random
 
 # Page config
 st.set_page_config(
@@ -80,6 +81,14 @@ def show_mitra_header():
     </div>
     """, unsafe_allow_html=True)
 
+# Current mood card template
+CURRENT_MOOD_HTML = """
+<div style="background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); 
+           padding: 1rem; border-radius: 10px; text-align: center; margin: 1rem 0;">
+    <h4 style="margin: 0; color: #2e7d32;">Current Mood: {emoji} {mood}</h4>
+</div>
+"""
+
 def show_mood_selector():
     """Show enhanced mood selection interface"""
     
@@ -130,12 +139,10 @@ def show_mood_selector():
     current_mood = session_manager.get_preference("current_mood")
     if current_mood:
         mood_emoji = [k for k, v in moods.items() if v == current_mood][0]
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); 
-                   padding: 1rem; border-radius: 10px; text-align: center; margin: 1rem 0;">
-            <h4 style="margin: 0; color: #2e7d32;">Current Mood: {mood_emoji} {current_mood}</h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            CURRENT_MOOD_HTML.format(emoji=mood_emoji, mood=current_mood),
+            unsafe_allow_html=True
+        )
 
 def show_conversation_starters():
     """Show conversation starter suggestions"""
@@ -341,23 +348,23 @@ def show_mitra_features():
         - Memory of your feelings
         """)
 
+# Wellness tips (built once, not on every rerun)
+WELLNESS_TIPS = (
+    "🌅 Start your day with gratitude - think of 3 things you're thankful for",
+    "🧘‍♀️ Take 5 deep breaths when feeling stressed",
+    "🚶‍♀️ A short walk can boost your mood significantly",
+    "💧 Stay hydrated - your brain needs water to function well",
+    "📱 Take breaks from social media to reduce anxiety",
+    "😴 Prioritize 7-8 hours of sleep for emotional balance",
+    "🎵 Listen to music that makes you feel good",
+    "📝 Journal your thoughts to process emotions"
+)
+
 def show_wellness_tips():
     """Show wellness and self-care tips"""
     
     with st.expander("🌱 Daily Wellness Tips", expanded=False):
-        tips = [
-            "🌅 Start your day with gratitude - think of 3 things you're thankful for",
-            "🧘‍♀️ Take 5 deep breaths when feeling stressed",
-            "🚶‍♀️ A short walk can boost your mood significantly", 
-            "💧 Stay hydrated - your brain needs water to function well",
-            "📱 Take breaks from social media to reduce anxiety",
-            "😴 Prioritize 7-8 hours of sleep for emotional balance",
-            "🎵 Listen to music that makes you feel good",
-            "📝 Journal your thoughts to process emotions"
-        ]
-        
-        import random
-        daily_tip = random.choice(tips)
+        daily_tip = random.choice(WELLNESS_TIPS)
         st.info(f"**Today's Tip:** {daily_tip}")
         
         if st.button("🔄 Get Another Tip"):
@@ -7,7 +7,6 @@ Dedicated page for learning, skill development, and educational guidance.
 
 import streamlit as st
 from datetime import datetime
-import time
 
 # Page config
 st.set_page_config(
@@ -619,6 +618,18 @@ def get_fallback_questions(topic: str, num_questions: int):
     
     return questions
 
+def show_answer_feedback(quiz_state: dict):
+    """Show feedback for the previously submitted quiz answer (once)"""
+    feedback = quiz_state.pop("last_feedback", None)
+    if not feedback:
+        return
+    
+    if feedback["is_correct"]:
+        st.success(f"✅ Correct! {feedback['explanation']}")
+    else:
+        st.error(f"❌ Incorrect. The correct answer is {feedback['correct_answer']}.")
+        st.info(f"💡 {feedback['explanation']}")
+
 def show_quiz_interface():
     """Show interactive MCQ quiz interface"""
     
@@ -730,6 +741,8 @@ def show_quiz_interface():
         current_q = quiz_state["current_question"]
         total_q = len(quiz_state["questions"])
         
+        show_answer_feedback(quiz_state)
+        
         # Progress bar
         progress = (current_q) / total_q
         st.progress(progress, text=f"Question {current_q + 1} of {total_q}")
@@ -760,11 +773,14 @@ def show_quiz_interface():
                     is_correct = user_answer == correct_answer
                     
                     if is_correct:
-                        st.success(f"✅ Correct! {question_data['explanation']}")
                         quiz_state["score"] += 1
-                    else:
-                        st.error(f"❌ Incorrect. The correct answer is {correct_answer}.")
-                        st.info(f"💡 {question_data['explanation']}")
+                    
+                    # Shown on the next rerun instead of blocking the script thread
+                    quiz_state["last_feedback"] = {
+                        "is_correct": is_correct,
+                        "correct_answer": correct_answer,
+                        "explanation": question_data["explanation"]
+                    }
                     
                     quiz_state["answers"].append({
                         "question": question_data["question"],
@@ -773,8 +789,6 @@ def show_quiz_interface():
                         "is_correct": is_correct
                     })
                     
-                    time.sleep(2)  # Show feedback briefly
-                    
                     # Move to next question
                     quiz_state["current_question"] += 1
                     
@@ -790,6 +804,8 @@ def show_quiz_interface():
         total = len(quiz_state["questions"])
         percentage = (score / total) * 100
         
+        show_answer_feedback(quiz_state)
+        
         st.markdown("## 🎉 Quiz Completed!")
         
         # Score display
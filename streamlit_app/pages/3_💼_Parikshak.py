@@ -9,6 +9,7 @@ import streamlit as st
 from datetime import datetime
 import time
 import json
+import random
 
 # Page config
 st.set_page_config(
@@ -235,37 +236,37 @@ def show_live_feedback():
             delta=f"+{score-70}%" if score > 70 else f"{score-70}%"
         )
 
+# Interview question bank (built once, not on every rerun)
+INTERVIEW_QUESTIONS = {
+    "💼 HR Interview": (
+        "Tell me about yourself and your career journey.",
+        "Why do you want to work for our company?",
+        "Describe a challenging situation you faced and how you handled it.",
+        "What are your greatest strengths and weaknesses?",
+        "Where do you see yourself in 5 years?"
+    ),
+    "💻 Technical Interview": (
+        "Explain the difference between Python lists and tuples.",
+        "How would you optimize a slow database query?",
+        "Design a system to handle 1 million concurrent users.",
+        "What is your approach to debugging complex issues?",
+        "Explain object-oriented programming concepts."
+    ),
+    "🎯 Case Study": (
+        "How would you increase user engagement for a mobile app?",
+        "Design a solution for reducing customer wait times.",
+        "Analyze the pros and cons of remote work policies.",
+        "How would you handle a data breach incident?",
+        "Create a strategy for entering a new market."
+    )
+}
+
 def generate_interview_question():
     """Generate interview questions based on type"""
     
     interview_type = st.session_state.get("current_interview_type", "HR Interview")
     
-    questions_db = {
-        "💼 HR Interview": [
-            "Tell me about yourself and your career journey.",
-            "Why do you want to work for our company?",
-            "Describe a challenging situation you faced and how you handled it.",
-            "What are your greatest strengths and weaknesses?",
-            "Where do you see yourself in 5 years?"
-        ],
-        "💻 Technical Interview": [
-            "Explain the difference between Python lists and tuples.",
-            "How would you optimize a slow database query?",
-            "Design a system to handle 1 million concurrent users.",
-            "What is your approach to debugging complex issues?",
-            "Explain object-oriented programming concepts."
-        ],
-        "🎯 Case Study": [
-            "How would you increase user engagement for a mobile app?",
-            "Design a solution for reducing customer wait times.",
-            "Analyze the pros and cons of remote work policies.",
-            "How would you handle a data breach incident?",
-            "Create a strategy for entering a new market."
-        ]
-    }
-    
-    questions = questions_db.get(interview_type, questions_db["💼 HR Interview"])
-    import random
+    questions = INTERVIEW_QUESTIONS.get(interview_type, INTERVIEW_QUESTIONS["💼 HR Interview"])
     question = random.choice(questions)
     
     st.info(f"**Interview Question:** {question}")
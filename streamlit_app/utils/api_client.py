@@ -10,10 +10,19 @@ import json
 import aiohttp
 import requests
 import streamlit as st
-from typing import Dict, List, Optional, Any, AsyncGenerator
+from typing import Dict, List, Optional, Any, AsyncGenerator, Union
 import websockets
+import orjson
 from .config import config
 
+def _ws_dumps(message: Dict[str, Any]) -> str:
+    """Encode a WebSocket message (text frame, the backend reads with receive_text)"""
+    return orjson.dumps(message).decode()
+
+def _ws_loads(raw: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode a WebSocket message"""
+    return orjson.loads(raw)
+
 class BuddyAgentsAPI:
     """Synchronous API client for BuddyAgents backend"""
     
@@ -161,10 +170,8 @@ class BuddyAgentsAPI:
     def upload_document(self, agent: str, files: Dict[str, Any]) -> Dict[str, Any]:
         """Upload document to backend for processing"""
         try:
-            # Remove Content-Type header for file uploads
-            headers = dict(self.session.headers)
-            if "Content-Type" in headers:
-                del headers["Content-Type"]
+            # Drop the session's JSON Content-Type so requests sets the multipart boundary
+            headers = {"Content-Type": None}
             
             # Get user/candidate ID
             user_id = "anonymous_user"
@@ -177,7 +184,7 @@ class BuddyAgentsAPI:
             }
             
             url = f"{self.base_url}/api/v1/documents/{agent}/upload"
-            response = requests.post(url, files=files, data=form_data, headers=headers)
+            response = self.session.post(url, files=files, data=form_data, headers=headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -215,7 +222,7 @@ class AsyncBuddyAgentsAPI:
     async def send_websocket_message(self, websocket, message: Dict[str, Any]):
         """Send message via WebSocket"""
         try:
-            await websocket.send(json.dumps(message))
+            await websocket.send(_ws_dumps(message))
         except Exception as e:
             st.error(f"WebSocket send failed: {e}")
             raise
@@ -224,7 +231,7 @@ class AsyncBuddyAgentsAPI:
         """Receive message from WebSocket"""
         try:
             message = await websocket.recv()
-            return json.loads(message)
+            return _ws_loads(message)
         except Exception as e:
             st.error(f"WebSocket receive failed: {e}")
             raise
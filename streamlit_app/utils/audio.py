@@ -7,9 +7,7 @@ Handles audio playback, recording, and voice processing for BuddyAgents.
 
 import streamlit as st
 import io
-import base64
 from typing import Optional
-import numpy as np
 import streamlit.components.v1 as components
 
 class AudioManager:
@@ -71,7 +69,6 @@ class AudioManager:
     def create_audio_player(self, audio_data: bytes, key: Optional[str] = None) -> bool:
         """Create an audio player widget using safe BytesIO method"""
         try:
-            import io
             audio_io = io.BytesIO(audio_data)
             st.audio(audio_io, format=self.audio_format)
             return True
@@ -259,6 +256,3 @@ def show_audio_controls(voice_enabled: bool = True) -> dict:
         )
     
     return controls
-
-# Create global audio manager instance
-audio_manager = AudioManager()
@@ -6,9 +6,25 @@ Tests MCP integration and voice functionality
 
 import asyncio
 import aiohttp
-import json
+import sys
 from datetime import datetime
 
+from app.core.http import json_dumps, read_json
+
+# Shared client settings: the tests only talk to a couple of hosts, so cache
+# DNS and keep per-host concurrency modest
+_TIMEOUT_30 = aiohttp.ClientTimeout(total=30)
+
+
+def _make_connector() -> aiohttp.TCPConnector:
+    """Build a pooled connector for the test client session"""
+    return aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+
 async def test_enhanced_chat():
     base_url = 'http://localhost:8000'
     
@@ -34,7 +50,11 @@ async def test_enhanced_chat():
         }
     ]
     
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(
+        connector=_make_connector(),
+        timeout=_TIMEOUT_30,
+        json_serialize=json_dumps
+    ) as session:
         # First, register a test candidate
         print('📝 Registering test candidate...')
         candidate_data = {
@@ -48,7 +68,7 @@ async def test_enhanced_chat():
         try:
             async with session.post(f'{base_url}/api/v1/candidates/register', json=candidate_data) as resp:
                 if resp.status == 200:
-                    candidate_response = await resp.json()
+                    candidate_response = await read_json(resp)
                     candidate_id = candidate_response['candidate_id']
                     print(f'✅ Candidate registered: {candidate_id}')
                 else:
@@ -61,49 +81,61 @@ async def test_enhanced_chat():
         
         print()
         
+        # Shared chat request fields; only message and agent_type vary
+        base_chat_data = {
+            "candidate_id": candidate_id,
+            "voice_enabled": False  # Disable voice for testing
+        }
+        json_headers = {"Content-Type": "application/json"}
+        
+        # Encode every chat request body up front
+        chat_bodies = [
+            json_dumps({**base_chat_data, "message": tc['message'], "agent_type": tc['agent']})
+            for tc in test_cases
+        ]
+        
         # Test each agent
-        for i, test_case in enumerate(test_cases, 1):
+        for i, (test_case, chat_body) in enumerate(zip(test_cases, chat_bodies), 1):
             agent = test_case['agent']
             message = test_case['message']
             description = test_case['description']
             
-            print(f'🤖 Test {i}/3: {agent.upper()} - {description}')
-            print(f'👤 User: {message}')
-            
-            # Prepare chat request
-            chat_data = {
-                "message": message,
-                "candidate_id": candidate_id,
-                "agent_type": agent,
-                "voice_enabled": False  # Disable voice for testing
-            }
+            # Collect this agent's report and write it out in one go
+            out = [
+                f'🤖 Test {i}/3: {agent.upper()} - {description}',
+                f'👤 User: {message}'
+            ]
             
             try:
-                async with session.post(f'{base_url}/api/v1/chat/enhanced', json=chat_data) as resp:
+                async with session.post(f'{base_url}/api/v1/chat/enhanced', data=chat_body, headers=json_headers) as resp:
                     if resp.status == 200:
-                        response = await resp.json()
-                        print(f'🤖 {agent.title()}: {response["response"]}')
-                        print(f'📊 Session: {response["session_id"][:8]}...')
-                        print(f'🎵 Voice: {response["voice_id"]}')
-                        print('✅ Success!')
+                        response = await read_json(resp)
+                        out.append(f'🤖 {agent.title()}: {response["response"]}')
+                        out.append(f'📊 Session: {response["session_id"][:8]}...')
+                        out.append(f'🎵 Voice: {response["voice_id"]}')
+                        out.append('✅ Success!')
                     else:
                         error_text = await resp.text()
-                        print(f'❌ Failed: {resp.status} - {error_text}')
+                        out.append(f'❌ Failed: {resp.status} - {error_text}')
                         
             except Exception as e:
-                print(f'❌ Error: {e}')
+                out.append(f'❌ Error: {e}')
             
-            print('-' * 40)
+            out.append('-' * 40)
+            sys.stdout.write('\n'.join(out) + '\n')
         
         # Test agent info endpoint
         print('📋 Testing agent info endpoint...')
         try:
             async with session.get(f'{base_url}/api/v1/chat/agents/info') as resp:
                 if resp.status == 200:
-                    agents_info = await resp.json()
-                    print(f'✅ Found {len(agents_info["agents"])} agents:')
-                    for agent_info in agents_info["agents"]:
-                        print(f'  - {agent_info["name"]}: {agent_info["voice_id"]} ({agent_info["language"]})')
+                    agents_info = await read_json(resp)
+                    lines = [f'✅ Found {len(agents_info["agents"])} agents:']
+                    lines.extend(
+                        f'  - {agent_info["name"]}: {agent_info["voice_id"]} ({agent_info["language"]})'
+                        for agent_info in agents_info["agents"]
+                    )
+                    sys.stdout.write('\n'.join(lines) + '\n')
                 else:
                     error_text = await resp.text()
                     print(f'❌ Failed: {resp.status} - {error_text}')
@@ -117,7 +149,7 @@ async def test_enhanced_chat():
         try:
             async with session.get(f'{base_url}/api/v1/candidates/candidate/{candidate_id}/progress') as resp:
                 if resp.status == 200:
-                    progress = await resp.json()
+                    progress = await read_json(resp)
                     print(f'✅ Progress tracked:')
                     print(f'  - Total sessions: {progress["total_sessions"]}')
                     print(f'  - Total messages: {progress["total_messages"]}')
@@ -133,4 +165,11 @@ async def test_enhanced_chat():
     print('=' * 60)
 
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard]; use it when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(test_enhanced_chat())
\ No newline at end of file
@@ -1,20 +1,42 @@
 import asyncio
 import os
-from app.murf_streaming import murf_service
+import sys
 from app.core.config import get_settings
 
-async def test_integration():
-    """Test the complete Murf integration"""
-    print("🧪 Testing Murf AI Integration...")
+async def _check_agent_voice(murf_service, agent: str) -> dict:
+    """Run HTTP and streaming synthesis checks for one agent"""
+    # Collect this agent's report so concurrent runs don't interleave output
+    out = [f"\n🎵 Testing {agent} voice..."]
     
-    # Load settings
-    settings = get_settings()
+    test_text = f"Hello, I am {agent}, your AI companion. How can I help you today?"
+    
+    # Test HTTP generation
+    audio_data = await murf_service.generate_speech_http(test_text, agent)
+    http_ok = bool(audio_data and len(audio_data) > 1000)
+    if http_ok:
+        out.append(f"   ✅ HTTP generation: {len(audio_data)} bytes")
+    else:
+        out.append(f"   ❌ HTTP generation failed")
     
-    # Check if API key is loaded from settings
-    if not murf_service.api_key:
-        murf_service.api_key = settings.MURF_API_KEY
-        print(f"🔑 Loaded API key from settings: {murf_service.api_key[:8]}...")
+    # Test streaming, accumulating audio in place
+    audio_buf = bytearray()
+    chunk_count = 0
+    async for chunk in murf_service.stream_speech_websocket(test_text, agent):
+        audio_buf += chunk
+        chunk_count += 1
+        if chunk_count >= 3:  # Test first few chunks
+            break
     
+    total_size = len(audio_buf)
+    if total_size > 0:
+        out.append(f"   ✅ Streaming: {chunk_count} chunks, {total_size} bytes")
+    else:
+        out.append(f"   ❌ Streaming failed")
+    
+    return {"http_ok": http_ok, "stream_ok": total_size > 0, "bytes": total_size, "report": out}
+
+async def _run_checks(murf_service):
+    """Validate the setup and exercise every agent voice"""
     # Validate setup
     results = await murf_service.validate_setup()
 
@@ -30,33 +52,53 @@ async def test_integration():
         print("❌ Authentication failed - check API key validity")
         print("ℹ️  Note: This is expected if the API key is invalid/expired")
 
-    # Test each agent voice
-    for agent in ["mitra", "guru", "parikshak"]:
-        print(f"\n🎵 Testing {agent} voice...")
-        
-        test_text = f"Hello, I am {agent}, your AI companion. How can I help you today?"
-        
-        # Test HTTP generation
-        audio_data = await murf_service.generate_speech_http(test_text, agent)
-        if audio_data and len(audio_data) > 1000:
-            print(f"   ✅ HTTP generation: {len(audio_data)} bytes")
-        else:
-            print(f"   ❌ HTTP generation failed")
-        
-        # Test streaming
-        chunks = []
-        async for chunk in murf_service.stream_speech_websocket(test_text, agent):
-            chunks.append(chunk)
-            if len(chunks) >= 3:  # Test first few chunks
-                break
-        
-        total_size = sum(len(chunk) for chunk in chunks)
-        if total_size > 0:
-            print(f"   ✅ Streaming: {len(chunks)} chunks, {total_size} bytes")
+    # Test each agent voice concurrently; reports are printed in agent order
+    agents = ("mitra", "guru", "parikshak")
+    agent_results = await asyncio.gather(
+        *(_check_agent_voice(murf_service, agent) for agent in agents),
+        return_exceptions=True
+    )
+    for agent, result in zip(agents, agent_results):
+        if isinstance(result, Exception):
+            sys.stdout.write(f"\n🎵 Testing {agent} voice...\n   ❌ Error: {result}\n")
         else:
-            print(f"   ❌ Streaming failed")
+            sys.stdout.write("\n".join(result["report"]) + "\n")
 
     print("\n🎯 Integration test completed!")
 
+async def test_integration():
+    """Test the complete Murf integration"""
+    print("🧪 Testing Murf AI Integration...")
+    
+    # Load settings
+    settings = get_settings()
+    
+    # Bail out before pulling in the streaming stack when no key is configured
+    if not (os.getenv("MURF_API_KEY") or settings.MURF_API_KEY):
+        print("❌ API key missing - check .env file")
+        return
+    
+    import aiohttp
+    from app.murf_streaming import MurfAIService
+    
+    # One pooled session shared by every Murf HTTP call in this run
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Fall back to the key from settings when MURF_API_KEY isn't in the environment
+        api_key = os.getenv("MURF_API_KEY")
+        if not api_key and settings.MURF_API_KEY:
+            api_key = settings.MURF_API_KEY
+            print(f"🔑 Loaded API key from settings: {api_key[:8]}...")
+        murf_service = MurfAIService(api_key=api_key, session=session)
+        
+        await _run_checks(murf_service)
+
 if __name__ == "__main__":
+    # uvloop ships with uvicorn[standard]; use it when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(test_integration())
\ No newline at end of file